@@ -1,13 +1,88 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+scriptDir = os.path.dirname(os.path.abspath(__file__))
+
+try:
+  import requests_cache
+except ImportError:
+  # caching is optional, fall back to plain sessions
+  requests_cache = None
+
+urls = ["<the link goes here>"]
+timeout = 10
+maxWorkers = 20
+useCache = True
+
+# only build tree nodes for <a href> tags, everything else is skipped
+onlyLinks = SoupStrainer('a', href=True)
+
+
+def fetch(session, url):
+  try:
+    r = session.get(url, timeout=timeout)
+    r.raise_for_status()
+  except requests.RequestException as e:
+    # one bad url should not stop the links of the others being printed
+    print(f"failed to fetch {url}: {e}", file=sys.stderr)
+    return None
+  return r.content
+
+
+def makeSession():
+  if useCache and requests_cache is not None:
+    # repeated runs on the same urls are answered from a local sqlite cache
+    # keep the cache next to the script, wherever it is run from
+    cacheName = os.path.join(scriptDir, 'scraper_cache')
+    return requests_cache.CachedSession(cacheName, backend='sqlite',
+                                        expire_after=3600,
+                                        allowable_codes=(200,))
+  return requests.Session()
+
+
+def getLinks(htmlContent):
+  try:
+    soup = BeautifulSoup(htmlContent, 'lxml', parse_only=onlyLinks)
+  except FeatureNotFound:
+    # lxml is not installed, use the slower built-in parser
+    soup = BeautifulSoup(htmlContent, 'html.parser', parse_only=onlyLinks)
+  # nav/footer links repeat a lot, keep the first occurrence of each href
+  return list(dict.fromkeys(link['href'] for link in soup.find_all('a')))
+
+
+def main():
+  with makeSession() as session:
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=maxWorkers,
+                          max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    # pages are downloaded concurrently, results come back in url order
+    with ThreadPoolExecutor(max_workers=maxWorkers) as pool:
+      pages = list(pool.map(lambda url: fetch(session, url), urls))
+
+  pages = [htmlContent for htmlContent in pages if htmlContent is not None]
 
-url = "<the link goes here>"
+  if len(pages) > 1:
+    # parsing is CPU bound, so spread it over processes instead of threads
+    # fork starts every worker up front, so never ask for more than there are pages
+    workers = min(len(pages), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+      results = list(pool.map(getLinks, pages))
+  else:
+    # not worth starting worker processes for a single page
+    results = [getLinks(htmlContent) for htmlContent in pages]
 
-r = requests.get(url)
-htmlContent = r.content
+  for links in results:
+    for href in links:
+      print(href)
 
-soup = BeautifulSoup(htmlContent, 'html.parser')
-anchors = soup.find_all('a')
 
-for link in anchors:
-  print(link['href'])
+if __name__ == '__main__':
+  main()